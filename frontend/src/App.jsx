@@ -30,8 +30,8 @@ function App() {
         }
         try {
             const [recipes, ingredients] = await Promise.all([
-                apiClient('/recipes/'),
-                apiClient('/ingredients/')
+                apiClient('/recipes/', 'GET', null, { onUpdate: (data) => setRecipeCount(data.length) }),
+                apiClient('/ingredients/', 'GET', null, { onUpdate: (data) => setIngredientCount(data.length) })
             ]);
             setRecipeCount(recipes.length);
             setIngredientCount(ingredients.length);
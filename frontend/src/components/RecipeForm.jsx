@@ -32,7 +32,7 @@ const RecipeForm = ({ recipe, onSave, onCancel }) => {
     // --- STEP A: Fetch Global Ingredients on Load ---
     const fetchMasterIngredients = useCallback(async () => {
         try {
-            const data = await apiClient('/ingredients/'); 
+            const data = await apiClient('/ingredients/', 'GET', null, { onUpdate: setMasterIngredients });
             setMasterIngredients(data);
         } catch (err) {
             console.error("Failed to fetch master ingredients:", err);
@@ -2,6 +2,7 @@
 import React, { createContext, useState, useContext, useEffect } from 'react';
 import axios from 'axios';
 import { useNavigate } from 'react-router-dom';
+import { createRequestCache } from './requestCache';
 
 const API_BASE_URL = 'http://127.0.0.1:8002'; 
 const AuthContext = createContext();
@@ -13,6 +14,8 @@ export const AuthProvider = ({ children }) => {
     const [user, setUser] = useState(null);
     const [token, setToken] = useState(localStorage.getItem('access_token') || null);
     const [isLoading, setIsLoading] = useState(true);
+    // One cache per provider: survives re-renders, dropped on logout
+    const [requestCache] = useState(() => createRequestCache());
 
     // Set axios default headers and fetch user data on mount/token change
     useEffect(() => {
@@ -28,6 +31,7 @@ export const AuthProvider = ({ children }) => {
         setToken(null);
         setUser(null);
         localStorage.removeItem('access_token');
+        requestCache.clear();
         delete axios.defaults.headers.common['Authorization'];
         navigate('/login');
     };
@@ -44,6 +48,7 @@ export const AuthProvider = ({ children }) => {
 
             const newToken = response.data.access_token;
             
+            requestCache.clear();
             setToken(newToken);
             localStorage.setItem('access_token', newToken);
             axios.defaults.headers.common['Authorization'] = `Bearer ${newToken}`;
@@ -60,14 +65,8 @@ export const AuthProvider = ({ children }) => {
         }
     };
     
-    // Function to handle all authenticated requests (Crucial for Requirement 5)
-    const apiClient = async (url, method = 'GET', data = null) => {
-        if (!token) {
-            console.error("No token available. User is not authenticated.");
-            logout();
-            return;
-        }
-
+    // Sends a single request to the backend (no caching)
+    const sendRequest = async (url, method, data) => {
         const config = {
             method: method,
             url: `${API_BASE_URL}${url}`,
@@ -91,6 +90,32 @@ export const AuthProvider = ({ children }) => {
         }
     };
 
+    // Function to handle all authenticated requests (Crucial for Requirement 5)
+    // GETs go through the request cache (deduplicated + stale-while-revalidate);
+    // pass { onUpdate } to receive the refreshed data when a stale result was returned.
+    // Anything else is sent directly and invalidates the cached GETs it affects.
+    const apiClient = async (url, method = 'GET', data = null, { onUpdate = null } = {}) => {
+        if (!token) {
+            console.error("No token available. User is not authenticated.");
+            logout();
+            return;
+        }
+
+        if (method.toUpperCase() === 'GET') {
+            return requestCache.get(token, url, () => sendRequest(url, 'GET', data), onUpdate);
+        }
+
+        const result = await sendRequest(url, method, data);
+        requestCache.invalidate(method.toUpperCase(), url);
+        return result;
+    };
+
+    // Warms the cache for a GET the user is likely to need next (e.g. on hover)
+    const prefetch = (url) => {
+        if (!token) return;
+        requestCache.prefetch(token, url, () => sendRequest(url, 'GET', null));
+    };
+
     const contextValue = {
         token,
         user,
@@ -99,6 +124,7 @@ export const AuthProvider = ({ children }) => {
         login,
         logout,
         apiClient, // <-- Exposed for all components to use
+        prefetch,
         API_BASE_URL
     };
 
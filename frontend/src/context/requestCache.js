@@ -0,0 +1,125 @@
+// C:\frontend\src\context\requestCache.js
+
+// Client-side request layer used by AuthContext's apiClient:
+// - identical in-flight GETs share one network request
+// - GET results are cached per user + URL (stale-while-revalidate: stale data is
+//   returned at once, and the caller's onUpdate receives the refreshed data)
+// - mutations invalidate the cached GETs they affect
+
+// Cached data younger than this is returned without touching the network
+const FRESH_MS = 15 * 1000;
+// Older data (up to this age) is returned immediately while a background refresh runs
+const STALE_MS = 5 * 60 * 1000;
+
+// Strips trailing slashes so '/recipes/' and '/recipes' are the same resource
+const normalizePath = (url) => url.split('?')[0].replace(/\/+$/, '') || '/';
+
+// Extra resources a mutation affects beyond its own path, its parents and its children.
+// (GET /ingredients/ lists the ingredients linked to the user's recipes, and
+// GET /recipes/{id} includes ingredient names.)
+const RELATED_INVALIDATIONS = [
+    { method: 'DELETE', pattern: /^\/recipes\/\d+$/, paths: ['/ingredients'] },
+    { method: '*', pattern: /^\/recipes\/\d+\/ingredients(\/\d+)?$/, paths: ['/ingredients'] },
+    { method: '*', pattern: /^\/ingredients\/\d+$/, paths: ['/recipes'] },
+];
+
+export const createRequestCache = () => {
+    const entries = new Map();   // key -> { data, fetchedAt }
+    const inFlight = new Map();  // key -> { promise, generation }
+    let generation = 0;          // bumped on every invalidation
+
+    const makeKey = (userKey, url) => `${userKey}|${url}`;
+
+    // Starts (or joins) the network request for a GET and stores its result
+    const load = (key, send) => {
+        const pending = inFlight.get(key);
+        if (pending) {
+            return pending.promise;
+        }
+
+        const startedAt = generation;
+        const promise = send()
+            .then((data) => {
+                // Don't cache a response that may predate a mutation made while it was in flight
+                if (startedAt === generation) {
+                    entries.set(key, { data, fetchedAt: Date.now() });
+                }
+                return data;
+            })
+            .finally(() => {
+                if (inFlight.get(key)?.promise === promise) {
+                    inFlight.delete(key);
+                }
+            });
+
+        inFlight.set(key, { promise, generation: startedAt });
+        return promise;
+    };
+
+    const get = (userKey, url, send, onUpdate = null) => {
+        const key = makeKey(userKey, url);
+        const entry = entries.get(key);
+        const age = entry ? Date.now() - entry.fetchedAt : Infinity;
+
+        if (age < FRESH_MS) {
+            return Promise.resolve(entry.data);
+        }
+        if (age < STALE_MS) {
+            // Serve stale data now, hand the refreshed data to onUpdate when it arrives
+            load(key, send)
+                .then((data) => {
+                    // Skip results discarded by a mutation made during the refresh
+                    if (onUpdate && entries.get(key)?.data === data) onUpdate(data);
+                })
+                .catch((error) => {
+                    console.error(`Background refresh of ${url} failed:`, error);
+                });
+            return Promise.resolve(entry.data);
+        }
+        return load(key, send);
+    };
+
+    // Warms the cache without surfacing errors to the caller
+    const prefetch = (userKey, url, send) => {
+        get(userKey, url, send).catch(() => {});
+    };
+
+    // Drops every cached GET affected by a mutation on `url`
+    const invalidate = (method, url) => {
+        const path = normalizePath(url);
+        const targets = [path];
+        RELATED_INVALIDATIONS.forEach((rule) => {
+            if ((rule.method === '*' || rule.method === method) && rule.pattern.test(path)) {
+                targets.push(...rule.paths);
+            }
+        });
+
+        const isAffected = (cachedUrl) => {
+            const cachedPath = normalizePath(cachedUrl);
+            return targets.some((target) =>
+                // same resource, a child of it, or one of its parent collections
+                cachedPath === target ||
+                cachedPath.startsWith(`${target}/`) ||
+                target.startsWith(`${cachedPath}/`)
+            );
+        };
+
+        generation += 1;
+        [entries, inFlight].forEach((map) => {
+            for (const key of Array.from(map.keys())) {
+                const cachedUrl = key.slice(key.indexOf('|') + 1);
+                if (isAffected(cachedUrl)) {
+                    map.delete(key);
+                }
+            }
+        });
+    };
+
+    const clear = () => {
+        generation += 1;
+        entries.clear();
+        inFlight.clear();
+    };
+
+    return { get, prefetch, invalidate, clear };
+};
@@ -27,8 +27,10 @@ const IngredientListPage = () => {
         setError(null);
         try {
             // Calls the FastAPI endpoint: GET /ingredients/
-            const data = await apiClient('/ingredients/');
-            setIngredients(data.sort((a, b) => a.name.localeCompare(b.name)));
+            // Sort a copy: the array is shared with the request cache
+            const showSorted = (list) => setIngredients([...list].sort((a, b) => a.name.localeCompare(b.name)));
+            const data = await apiClient('/ingredients/', 'GET', null, { onUpdate: showSorted });
+            showSorted(data);
         } catch (err) {
             console.error("Failed to fetch ingredients:", err);
             setError("Failed to load ingredients list.");
@@ -1,17 +1,18 @@
 // C:\frontend\src\pages\RecipeListPage.jsx
 
-import React, { useEffect, useState, useCallback } from 'react';
+import React, { useEffect, useState, useCallback, useRef } from 'react';
 import { useAuth } from '../context/AuthContext.jsx';
 import { Container, Row, Col, Button, Table, Spinner, Alert } from 'react-bootstrap';
 import RecipeForm from '../components/RecipeForm.jsx'; // <--- Note the explicit .jsx extension!
 
 const RecipeListPage = () => {
-    const { apiClient, isAuthenticated } = useAuth();
+    const { apiClient, prefetch, isAuthenticated } = useAuth();
     const [recipes, setRecipes] = useState([]);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
     const [showForm, setShowForm] = useState(false);
     const [editingRecipe, setEditingRecipe] = useState(null); // Null for Create, object for Edit
+    const hoverTimer = useRef(null);
 
     // --- READ OPERATION: Fetch all recipes for the user ---
     const fetchRecipes = useCallback(async () => {
@@ -23,7 +24,7 @@ const RecipeListPage = () => {
         setError(null);
         try {
             // Calls the FastAPI endpoint: GET /recipes/
-            const data = await apiClient('/recipes/');
+            const data = await apiClient('/recipes/', 'GET', null, { onUpdate: setRecipes });
             setRecipes(data);
         } catch (err) {
             console.error("Failed to fetch recipes:", err);
@@ -69,6 +70,19 @@ const handleEdit = async (recipeSummary) => {
         setLoading(false); // Stop loading regardless of success/fail
     }
 };
+    // --- HOVER PREFETCH ---
+    // Only prefetch once the pointer rests on a row, not on every row it crosses
+    const handleRowEnter = (recipeId) => {
+        clearTimeout(hoverTimer.current);
+        hoverTimer.current = setTimeout(() => prefetch(`/recipes/${recipeId}`), 150);
+    };
+
+    const handleRowLeave = () => {
+        clearTimeout(hoverTimer.current);
+    };
+
+    useEffect(() => () => clearTimeout(hoverTimer.current), []);
+
     // --- DELETE OPERATION ---
     const handleDelete = async (recipeId) => {
         if (!window.confirm("Are you sure you want to delete this recipe? This action is irreversible.")) {
@@ -139,7 +153,8 @@ const handleEdit = async (recipeSummary) => {
                     </thead>
                     <tbody>
                         {recipes.map((recipe) => (
-                            <tr key={recipe.id}>
+                            // Prefetch details on hover so "Edit" opens without waiting
+                            <tr key={recipe.id} onMouseEnter={() => handleRowEnter(recipe.id)} onMouseLeave={handleRowLeave}>
                                 <td>{recipe.id}</td>
                                 <td>{recipe.title}</td>
                                 <td>{recipe.description}</td>
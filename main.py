@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 # Use absolute imports
 import models, schemas, crud, security 
+from ratelimit import RateLimitMiddleware
 from database import get_db
 from models import create_db_tables 
 
@@ -26,6 +27,10 @@ origins = [
     "http://127.0.0.1:5173",  
 ]
 
+# Rate limiting / load shedding. Added before CORS so CORS stays outermost
+# and 429/503 responses still carry the CORS headers the browser needs.
+app.add_middleware(RateLimitMiddleware)
+
 # Add the middleware to your app
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,283 @@
+# ratelimit.py
+import asyncio
+import logging
+import math
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from jose import JWTError, jwt
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+import security
+from database import engine
+
+# --- Configuration ---
+# "memory" keeps buckets inside this process; "shared" keeps them in a SQLite file
+# so every worker process on the same host draws from the same buckets.
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_DB_PATH = os.getenv(
+    "RATE_LIMIT_DB_PATH", os.path.join(tempfile.gettempdir(), "recipe_manager_ratelimit.db")
+)
+
+# Bucket sizes (burst) and refill rates (tokens per second)
+USER_BUCKET_CAPACITY = 60
+USER_REFILL_PER_SECOND = 1.0
+IP_BUCKET_CAPACITY = 120
+IP_REFILL_PER_SECOND = 2.0
+
+# A bucket left alone this long has refilled to capacity, so it can be dropped
+# (a missing bucket starts full). Pruning runs at most once per interval.
+BUCKET_IDLE_SECONDS = max(
+    USER_BUCKET_CAPACITY / USER_REFILL_PER_SECOND,
+    IP_BUCKET_CAPACITY / IP_REFILL_PER_SECOND,
+)
+PRUNE_INTERVAL_SECONDS = 60
+
+# Route costs: (method, path regex, cost). First match wins, anything else costs DEFAULT_ROUTE_COST.
+# Login is expensive because of verify_password; writes cost more than reads.
+DEFAULT_ROUTE_COST = 1
+ROUTE_COSTS: List[Tuple[str, "re.Pattern[str]", int]] = [
+    ("POST", re.compile(r"^/auth/login/?$"), 10),
+    ("POST", re.compile(r"^/auth/register/?$"), 10),
+    ("POST", re.compile(r"^/recipes/\d+/ingredients/?$"), 3),
+    ("DELETE", re.compile(r"^/recipes/\d+/ingredients/\d+/?$"), 3),
+    ("POST", re.compile(r"^/recipes/?$"), 3),
+    ("PUT", re.compile(r"^/recipes/\d+/?$"), 3),
+    ("DELETE", re.compile(r"^/recipes/\d+/?$"), 3),
+    ("POST", re.compile(r"^/ingredients/?$"), 3),
+    ("DELETE", re.compile(r"^/ingredients/\d+/?$"), 3),
+]
+
+# Requests that wait longer than this for a free DB slot are shed with 503
+CONCURRENCY_WAIT_SECONDS = 0.5
+CONCURRENCY_RETRY_AFTER_SECONDS = 1
+
+logger = logging.getLogger(__name__)
+
+
+def get_route_cost(method: str, path: str) -> int:
+    """Returns the token cost of a request based on its method and path."""
+    for route_method, pattern, cost in ROUTE_COSTS:
+        if method == route_method and pattern.match(path):
+            return cost
+    return DEFAULT_ROUTE_COST
+
+
+def get_db_concurrency_limit() -> int:
+    """Sizes the concurrency gate to the number of connections the engine's pool can hand out."""
+    pool = engine.pool
+    size = pool.size() if hasattr(pool, "size") else 5
+    overflow = getattr(pool, "_max_overflow", 0)
+    return max(1, size + max(0, overflow))
+
+
+# --- Token Bucket Backends ---
+# Both backends take a list of (key, capacity, refill_per_second) buckets and charge
+# `cost` to all of them only if every bucket has enough tokens.
+
+Bucket = Tuple[str, int, float]
+
+
+def _refill(tokens: float, updated: float, now: float, capacity: int, refill_per_second: float) -> float:
+    return min(float(capacity), tokens + max(0.0, now - updated) * refill_per_second)
+
+
+class InMemoryBackend:
+    """Token buckets held in a dict; limits apply per worker process."""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._last_prune = time.monotonic()
+
+    def take(self, buckets: List[Bucket], cost: int) -> float:
+        """
+        Tries to remove `cost` tokens from every bucket.
+        Returns 0 on success, otherwise the number of seconds until all buckets have enough
+        tokens (in which case nothing is charged).
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+                self._prune(now)
+
+            levels = []
+            wait = 0.0
+            for key, capacity, refill_per_second in buckets:
+                tokens, updated = self._buckets.get(key, (float(capacity), now))
+                tokens = _refill(tokens, updated, now, capacity, refill_per_second)
+                levels.append((key, tokens))
+                if tokens < cost:
+                    wait = max(wait, (cost - tokens) / refill_per_second)
+
+            for key, tokens in levels:
+                self._buckets[key] = (tokens if wait else tokens - cost, now)
+        return wait
+
+    def _prune(self, now: float):
+        idle = [key for key, (_, updated) in self._buckets.items() if now - updated >= BUCKET_IDLE_SECONDS]
+        for key in idle:
+            del self._buckets[key]
+        self._last_prune = now
+
+
+class SharedBackend:
+    """
+    Token buckets stored in a SQLite file so that all worker processes on one host
+    share the same limits. Each take() runs in its own IMMEDIATE transaction.
+    Raises sqlite3.Error if the file is locked for too long or cannot be written.
+    """
+
+    def __init__(self, path: str = RATE_LIMIT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._last_prune = 0.0
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=1.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn = conn
+        return conn
+
+    def take(self, buckets: List[Bucket], cost: int) -> float:
+        """Same contract as InMemoryBackend.take, using wall-clock time shared across processes."""
+        now = time.time()
+        conn = self._connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            if now - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+                conn.execute("DELETE FROM buckets WHERE updated < ?", (now - BUCKET_IDLE_SECONDS,))
+                self._last_prune = now
+
+            levels = []
+            wait = 0.0
+            for key, capacity, refill_per_second in buckets:
+                row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+                tokens, updated = row if row else (float(capacity), now)
+                tokens = _refill(tokens, updated, now, capacity, refill_per_second)
+                levels.append((key, tokens))
+                if tokens < cost:
+                    wait = max(wait, (cost - tokens) / refill_per_second)
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                [(key, tokens if wait else tokens - cost, now) for key, tokens in levels],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                try:
+                    conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    # Keep the original error; the connection is unusable either way
+                    self._local.conn = None
+            raise
+        return wait
+
+
+def get_backend():
+    """Builds the backend selected by RATE_LIMIT_BACKEND."""
+    if RATE_LIMIT_BACKEND == "shared":
+        return SharedBackend()
+    return InMemoryBackend()
+
+
+# --- Middleware ---
+
+def _user_from_request(request: Request) -> Optional[str]:
+    """
+    Reads the user's email from the bearer token without touching the database.
+    Invalid tokens return None; security.get_current_user still rejects them later.
+    """
+    auth_header = request.headers.get("authorization", "")
+    scheme, _, token = auth_header.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = jwt.decode(token, security.SECRET_KEY, algorithms=[security.ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("sub")
+
+
+def _too_many_requests(retry_after: float) -> JSONResponse:
+    seconds = max(1, math.ceil(retry_after))
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many requests. Please slow down."},
+        headers={"Retry-After": str(seconds)},
+    )
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """
+    Sheds load before any route handler opens a DB session:
+    1. Per-IP and per-user token buckets, charged by route cost -> 429 + Retry-After.
+    2. A concurrency gate sized to the DB pool -> 503 + Retry-After when saturated.
+    """
+
+    def __init__(self, app, backend=None, max_concurrency: Optional[int] = None):
+        super().__init__(app)
+        self.backend = backend or get_backend()
+        self.max_concurrency = max_concurrency or get_db_concurrency_limit()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _take(self, buckets: List[Bucket], cost: int) -> float:
+        try:
+            # SQLite may wait on another worker's lock, so keep it off the event loop
+            if isinstance(self.backend, SharedBackend):
+                return await run_in_threadpool(self.backend.take, buckets, cost)
+            return self.backend.take(buckets, cost)
+        except sqlite3.Error:
+            # Fail open: the concurrency gate below still protects the database
+            logger.exception("Rate limit backend unavailable; letting request through")
+            return 0.0
+
+    async def dispatch(self, request: Request, call_next):
+        # CORS preflight requests never reach the database
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
+        cost = get_route_cost(request.method, request.url.path)
+
+        # Check the IP and user buckets together so a rejected request charges neither
+        client_ip = request.client.host if request.client else "unknown"
+        buckets: List[Bucket] = [(f"ip:{client_ip}", IP_BUCKET_CAPACITY, IP_REFILL_PER_SECOND)]
+        user = _user_from_request(request)
+        if user:
+            buckets.append((f"user:{user}", USER_BUCKET_CAPACITY, USER_REFILL_PER_SECOND))
+
+        retry_after = await self._take(buckets, cost)
+        if retry_after:
+            return _too_many_requests(retry_after)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=CONCURRENCY_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            return JSONResponse(
+                status_code=503,
+                content={"detail": "Server is busy. Please try again shortly."},
+                headers={"Retry-After": str(CONCURRENCY_RETRY_AFTER_SECONDS)},
+            )
+        try:
+            return await call_next(request)
+        finally:
+            self._semaphore.release()